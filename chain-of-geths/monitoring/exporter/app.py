@@ -1,11 +1,30 @@
+import concurrent.futures
 import json
 import os
 import re
+import socket
+import sys
 import threading
 import time
 from typing import Any, Dict, List, Optional, Tuple
 
+try:
+    # C-backed JSON is a few times faster to parse; fall back to stdlib if
+    # the wheel isn't available for the platform.
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    # Small threaded WSGI server; the Flask dev server is single-threaded and
+    # re-parses per request. Fall back to it if the wheel isn't available.
+    from waitress import serve as _waitress_serve
+except ImportError:  # pragma: no cover
+    _waitress_serve = None
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 from flask import Flask, Response
 from prometheus_client import CONTENT_TYPE_LATEST, Gauge, generate_latest
 from pathlib import Path
@@ -48,7 +67,9 @@ def parse_node_urls(spec: str) -> List[Tuple[str, str]]:
         if "=" not in chunk:
             raise ValueError(f"Invalid NODE_URLS item (missing '='): {chunk}")
         name, url = chunk.split("=", 1)
-        name = name.strip()
+        # Node names are compared against constants on every poll; interning
+        # makes those pointer comparisons and guarantees they're pre-stripped.
+        name = sys.intern(name.strip())
         url = url.strip()
         if not name or not url:
             raise ValueError(f"Invalid NODE_URLS item (empty name/url): {chunk}")
@@ -56,50 +77,303 @@ def parse_node_urls(spec: str) -> List[Tuple[str, str]]:
     return out
 
 
-def rpc_call(url: str, method: str, params: Optional[list] = None, timeout: float = 5.0) -> Any:
+def _json_dumps_bytes(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _json_loads(data: Any) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class _TunedAdapter(HTTPAdapter):
+    """HTTPAdapter that disables Nagle and enables TCP keepalive.
+
+    The RPC traffic is tiny write+read pairs on pooled connections; Nagle can
+    hold the request bytes back waiting for an ACK, adding tens of ms per
+    round-trip for nothing.
+    """
+
+    _SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self._SOCKET_OPTIONS
+        return super().init_poolmanager(*args, **kwargs)
+
+
+# Shared keep-alive session for callers that don't have a Poller session handy.
+# The poller mounts its own session sized to the node count (see Poller.__init__).
+_default_session = requests.Session()
+_default_session.mount("http://", _TunedAdapter())
+_default_session.mount("https://", _TunedAdapter())
+
+
+# keep-alive lets us reuse the same socket across polls; the dict itself never
+# changes, so build it once instead of per request.
+_RPC_HEADERS = {"Content-Type": "application/json", "Connection": "keep-alive"}
+
+
+def rpc_call(
+    url: str,
+    method: str,
+    params: Optional[list] = None,
+    timeout: float = 5.0,
+    session: Optional[requests.Session] = None,
+) -> Any:
     payload = {
         "jsonrpc": "2.0",
         "id": 1,
         "method": method,
         "params": params or [],
     }
-    r = requests.post(url, json=payload, timeout=timeout)
+    s = session or _default_session
+    # JSON-RPC endpoints never legitimately redirect, so don't follow them.
+    r = s.post(
+        url,
+        data=_json_dumps_bytes(payload),
+        timeout=timeout,
+        headers=_RPC_HEADERS,
+        allow_redirects=False,
+    )
     r.raise_for_status()
-    body = r.json()
+    body = _json_loads(r.content)
     if "error" in body:
         raise RuntimeError(f"RPC error from {url} {method}: {body['error']}")
     return body.get("result")
 
-def rpc_call_optional(url: str, method: str, params: Optional[list] = None, timeout: float = 5.0) -> Any:
+def rpc_batch(
+    url: str,
+    calls: List[Tuple[str, list]],
+    timeout: float = 5.0,
+    session: Optional[requests.Session] = None,
+    body: Optional[bytes] = None,
+) -> List[Any]:
+    """POST several JSON-RPC calls as one batch array (one round trip).
+
+    Returns one entry per call, in call order, with None for per-entry errors.
+    Raises when the batch POST itself fails so callers can fall back to the
+    single-call path (very old clients reject batch arrays outright).
+
+    body, when given, is the pre-serialized payload for exactly these calls
+    (ids 0..len-1); callers with a fixed call list can encode it once.
+    """
+    if body is None:
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params or []}
+            for i, (method, params) in enumerate(calls)
+        ]
+        body = _json_dumps_bytes(payload)
+    s = session or _default_session
+    r = s.post(
+        url,
+        data=body,
+        timeout=timeout,
+        headers=_RPC_HEADERS,
+        allow_redirects=False,
+    )
+    r.raise_for_status()
+    body = _json_loads(r.content)
+    if not isinstance(body, list):
+        # A single error object, or a client that doesn't speak batches.
+        raise RuntimeError(f"Non-batch RPC response from {url}")
+    results: List[Any] = [None] * len(calls)
+    for entry in body:
+        if not isinstance(entry, dict) or "error" in entry:
+            continue
+        idx = entry.get("id")
+        if isinstance(idx, int) and 0 <= idx < len(calls):
+            results[idx] = entry.get("result")
+    return results
+
+
+# The per-node probe is the same three calls every poll, so serialize the
+# batch payload once at import time instead of rebuilding it per node per round.
+_PROBE_CALLS: List[Tuple[str, list]] = [
+    ("eth_blockNumber", []),
+    ("net_peerCount", []),
+    ("eth_syncing", []),
+]
+_PROBE_BODY = _json_dumps_bytes(
+    [
+        {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+        for i, (method, params) in enumerate(_PROBE_CALLS)
+    ]
+)
+
+
+# Short-TTL result cache keyed by (url, method). When something polls the
+# nodes faster than interval_seconds (extra scrapers, tight intervals), the
+# cache absorbs the duplicate RPCs. TTL of 0 disables it.
+_RPC_CACHE: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+_RPC_CACHE_TTL = _env_float("RPC_CACHE_TTL_SECONDS", 0.5)
+
+
+def rpc_call_optional(
+    url: str,
+    method: str,
+    params: Optional[list] = None,
+    timeout: float = 5.0,
+    session: Optional[requests.Session] = None,
+) -> Any:
     """RPC call that returns None on any failure.
 
     This keeps the exporter compatible with very old clients that may not implement
     newer JSON-RPC methods (or may implement them partially).
     """
+    cacheable = not params and _RPC_CACHE_TTL > 0
+    if cacheable:
+        hit = _RPC_CACHE.get((url, method))
+        if hit is not None and time.monotonic() - hit[0] < _RPC_CACHE_TTL:
+            return hit[1]
     try:
-        return rpc_call(url, method, params=params, timeout=timeout)
+        result = rpc_call(url, method, params=params, timeout=timeout, session=session)
     except Exception:
         return None
+    # Never cache a "not syncing" answer: hiding a just-started sync for a
+    # whole TTL window is worse than one extra RPC.
+    if cacheable and not (method == "eth_syncing" and (result is None or result is False)):
+        _RPC_CACHE[(url, method)] = (time.monotonic(), result)
+    return result
 
 
-def _http_get_json(url: str, timeout: float = 5.0) -> Any:
-    r = requests.get(url, timeout=timeout)
+def _http_get_json(url: str, timeout: float = 5.0, session: Optional[requests.Session] = None) -> Any:
+    s = session or _default_session
+    r = s.get(url, timeout=timeout)
     r.raise_for_status()
-    return r.json()
-
-
-def _http_get_text(url: str, timeout: float = 5.0) -> str:
-    r = requests.get(url, timeout=timeout)
-    r.raise_for_status()
-    return r.text
+    return _json_loads(r.content)
+
+
+def fetch_prom_metrics(
+    url: str,
+    wanted: Dict[str, str],
+    timeout: float = 5.0,
+    session: Optional[requests.Session] = None,
+) -> Dict[str, Optional[float]]:
+    """Stream a Prometheus /metrics page and pull out a few scalar values.
+
+    `wanted` maps metric name -> raw label-selector substring ("" accepts the
+    first series). A Lighthouse exposition runs to hundreds of KB; streaming
+    line by line and parsing candidate lines with plain string ops (the
+    format is strictly line-oriented) lets us close the connection as soon
+    as everything is found.
+    """
+    found: Dict[str, Optional[float]] = {name: None for name in wanted}
+    remaining = set(wanted)
+    s = session or _default_session
+    with s.get(url, timeout=timeout, stream=True) as r:
+        r.raise_for_status()
+        for raw in r.iter_lines():
+            if not raw or raw.startswith(b"#"):
+                continue
+            line = raw.decode("utf-8", errors="ignore")
+            for name in tuple(remaining):
+                if not line.startswith(name):
+                    continue
+                selector = wanted[name]
+                rest = line[len(name):]
+                if rest.startswith("{"):
+                    end = rest.find("}")
+                    if end < 0:
+                        continue
+                    if selector and selector not in rest[1:end]:
+                        continue
+                    rest = rest[end + 1:]
+                elif not rest[:1].isspace():
+                    # A longer metric name sharing this prefix.
+                    continue
+                elif selector:
+                    continue
+                # "value [timestamp]" — keep just the value field.
+                parts = rest.split()
+                if not parts:
+                    continue
+                try:
+                    found[name] = float(parts[0])
+                except ValueError:
+                    found[name] = None
+                remaining.discard(name)
+            if not remaining:
+                break
+    return found
+
+
+def _tail_bytes(path: Path, n: int = 500_000) -> bytes:
+    """Read at most the last `n` bytes of a file.
+
+    Seeks instead of slurping: geth logs can grow to multiple GB, and we only
+    ever look at the tail window. Returned raw — everything we scan for is
+    ASCII, so decoding 500 KB of UTF-8 per poll would be a second full pass
+    over the buffer for nothing.
+    """
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - n))
+        return f.read(n)
 
 
 def _read_json_file(path: Path) -> Any:
     try:
-        return json.loads(path.read_text())
+        return _json_loads(path.read_bytes())
     except Exception:
         return None
 
+# Prometheus exposition patterns, compiled once per (metric, labeled) pair.
+# The metric name is baked into the pattern, so Python's own regex cache can't
+# help here (the source string differs per metric).
+_PROM_PATTERN_CACHE: Dict[Tuple[str, bool], "re.Pattern[str]"] = {}
+
+
+def _prom_pattern(metric: str, labeled: bool) -> "re.Pattern[str]":
+    pat = _PROM_PATTERN_CACHE.get((metric, labeled))
+    if pat is None:
+        if labeled:
+            pat = re.compile(
+                rf"^{re.escape(metric)}\{{([^}}]*)\}}\s+([-+]?\d+(?:\.\d+)?)\s*$",
+                re.MULTILINE,
+            )
+        else:
+            pat = re.compile(
+                rf"^{re.escape(metric)}\s+([-+]?\d+(?:\.\d+)?)\s*$",
+                re.MULTILINE,
+            )
+        _PROM_PATTERN_CACHE[(metric, labeled)] = pat
+    return pat
+
+
+# Node display names with special handling in the poll loop. Names are
+# stripped once (at parse/loop entry), so these compare against clean strings.
+# The v1.11.6 bridge is gated until the offline seed has completed; the listed
+# nodes sync against the fixed historical cutoff instead of whatever
+# eth_syncing.highestBlock claims.
+_SEED_GATED_NODE = sys.intern("Geth v1.11.6")
+_CUTOFF_TARGET_NODES = frozenset(
+    sys.intern(n) for n in ("Geth v1.11.6", "Geth v1.10.8", "Geth v1.9.25", "Geth v1.3.6")
+)
+
+
+# Geth log lines scanned by the seeding stage checklist. Byte patterns: the
+# tails stay undecoded and only the captured digits ever become Python ints.
+_RE_IMPORTED_NEW = re.compile(rb"Imported new chain segment\s+number=([0-9,]+)")
+# Log parsing scans the last _PARSE_WINDOW bytes of the tail first and only
+# widens (doubling up to the full tail) when no signal is found there; the
+# lines we want are almost always within the last few KB.
+_PARSE_WINDOW = 64 * 1024
+
+# Old-format import lines are matched in two linear stages (rfind for the
+# "block(s)" literal, then the first "#<number>" after it) instead of one
+# pattern with an unanchored ".*?" bridge, which backtracks quadratically
+# on long lines where "#" never appears.
+_RE_HASH_NUM = re.compile(rb"#([0-9,]+)")
+_RE_EXPORTED = re.compile(rb"Exporting blocks\s+exported=([0-9,]+)")
+
+
 def _parse_prom_number(text: str, metric: str, label_selector: str = "") -> float | None:
     """Parse a single Prometheus exposition line.
 
@@ -110,11 +384,7 @@ def _parse_prom_number(text: str, metric: str, label_selector: str = "") -> floa
     `label_selector` is a raw substring that must appear inside the braces.
     """
     # Labeled series.
-    pat_labeled = re.compile(
-        rf"^{re.escape(metric)}\\{{([^}}]*)\\}}\\s+([-+]?\\d+(?:\\.\\d+)?)\\s*$",
-        re.MULTILINE,
-    )
-    for m in pat_labeled.finditer(text):
+    for m in _prom_pattern(metric, True).finditer(text):
         labels = m.group(1)
         if label_selector and label_selector not in labels:
             continue
@@ -125,8 +395,7 @@ def _parse_prom_number(text: str, metric: str, label_selector: str = "") -> floa
 
     # Unlabeled series.
     if not label_selector:
-        pat_plain = re.compile(rf"^{re.escape(metric)}\\s+([-+]?\\d+(?:\\.\\d+)?)\\s*$", re.MULTILINE)
-        m = pat_plain.search(text)
+        m = _prom_pattern(metric, False).search(text)
         if m:
             try:
                 return float(m.group(1))
@@ -161,6 +430,11 @@ def hex_to_int(value: Any) -> int:
     if isinstance(value, int):
         return value
     if isinstance(value, str):
+        # Fast path: geth always returns clean lowercase "0x..." strings, so
+        # skip the strip()/lower() copies and hand int() the bare digits —
+        # it then skips its own prefix scan too.
+        if value.startswith(("0x", "0X")):
+            return int(value[2:], 16)
         v = value.strip().lower()
         if v.startswith("0x"):
             return int(v, 16)
@@ -240,9 +514,69 @@ class Poller:
         self.interval_seconds = interval_seconds
         self.lighthouse_api_url = (lighthouse_api_url or "").strip().rstrip("/")
 
+        # One persistent session for the whole poll loop: HTTP keep-alive reuses
+        # sockets across polls instead of paying TCP (and TLS) setup per RPC.
+        self._session = requests.Session()
+        adapter = _TunedAdapter(
+            pool_connections=len(nodes) + 4,
+            pool_maxsize=len(nodes) + 4,
+            max_retries=0,
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # Worker pool for the per-poll fan-out. The poll is I/O-bound, so the
+        # poll window compresses to roughly the slowest node instead of the sum.
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(4, len(nodes) + 2),
+            thread_name_prefix="poll",
+        )
+
         # Use a stable Lighthouse label from env (or a deterministic default matching docker-compose).
         # This avoids the Lighthouse row disappearing at startup while the API is still booting.
         self.lighthouse_label = (os.environ.get("LIGHTHOUSE_DISPLAY_NAME", "") or "Lighthouse v8.0.1").strip()
+
+        # Children zeroed whenever the Lighthouse API is unreachable; resolved
+        # once so the down branch is a plain loop over cached wrappers. Only
+        # when Lighthouse is configured: .labels() instantiates the series,
+        # so resolving them unconditionally would emit phantom zero-valued
+        # Lighthouse rows in Lighthouse-less deployments.
+        self._lh_zero_children: tuple = ()
+        if self.lighthouse_api_url:
+            self._lh_zero_children = tuple(
+                g.labels(node=self.lighthouse_label)
+                for g in (
+                    g_up,
+                    g_syncing,
+                    g_sync_current,
+                    g_sync_highest,
+                    g_sync_remaining,
+                    g_effective_head,
+                    g_sync_target,
+                    g_sync_percent,
+                )
+            )
+
+        # Stage checklist config and the seeder's file layout. None of this
+        # changes while the exporter runs, so resolve it once here rather than
+        # on every trip through the poll loop.
+        self.cutoff_block = _env_int("CUTOFF_BLOCK", 1919999)
+        # Geth v1.0.x is Frontier-era; it cannot serve Homestead-era blocks.
+        # Track its progress against the last Frontier block instead of the global cutoff.
+        # Backwards-compatible env:
+        # - V1_0_3_TARGET_BLOCK (old)
+        # - V1_0_X_TARGET_BLOCK (new; applies to all v1.0.* nodes)
+        self.v1_0_target_block = _env_int("V1_0_X_TARGET_BLOCK", _env_int("V1_0_3_TARGET_BLOCK", 1149999))
+        self.lighthouse_metrics_url = (os.environ.get("LIGHTHOUSE_METRICS_URL", "") or "").strip().rstrip("/")
+
+        # How long we consider Lighthouse backfill "active" after observing progress.
+        self.backfill_activity_window_seconds = _env_float(
+            "LIGHTHOUSE_BACKFILL_ACTIVITY_WINDOW_SECONDS", 300.0
+        )
+        self._build_seed_paths(
+            Path(os.environ.get("HOST_OUTPUT_DIR", "/host_output")).resolve(),
+            self.cutoff_block,
+        )
         self._stop = threading.Event()
         self._thread = threading.Thread(target=self._run, name="poller", daemon=True)
 
@@ -257,6 +591,36 @@ class Poller:
         self._lh_backfill_last_total: float | None = None
         self._lh_backfill_last_inc_ts: float | None = None
 
+        # Tail-read cache keyed by (size, mtime_ns): most polls see an
+        # unchanged log, so skip re-reading (and re-share the tail between the
+        # import and export scans, which both look at the seed log).
+        self._log_tail_cache: Dict[Path, Tuple[Tuple[int, int], bytes]] = {}
+
+        # Parsed log results keyed the same way: an unchanged log costs one
+        # stat() per poll instead of a regex scan over the tail.
+        self._log_parse_cache: Dict[Tuple[Path, str], Tuple[Tuple[int, int], Any]] = {}
+
+        # Memoized Gauge.labels(...) children. Each .labels() call takes a lock
+        # and hashes the label values; the label sets here are small and
+        # stable, so resolve each child once and just .set() it afterwards.
+        self._child_cache: Dict[Tuple[Any, Tuple[Tuple[str, str], ...]], Any] = {}
+
+        # Last-emitted `progress` label per node, so the info metric is only
+        # relabelled when the string actually changes (instead of a full
+        # clear()+rebuild of every series each round).
+        self._last_progress_label: Dict[str, str] = {}
+
+        # Consecutive fetch failures per node; after a few, _fetch_node drops
+        # to a single short-timeout probe instead of paying full timeouts.
+        self._fail_count: Dict[str, int] = {}
+
+        # Whether the constant all-zero gauge block for the seed-gated bridge
+        # node has been emitted for the current gating episode.
+        self._gate_emitted = False
+
+        # Last emitted status per stage label; set_stage only writes changes.
+        self._last_stage: Dict[str, int] = {}
+
         # Optional: hide some nodes from *progress* panels (Stage progress / Sync progress tables).
         # This is useful for offline-seeded "bridge" nodes in remote deployment, where the
         # export/import synthetic rows are the intended progress signal.
@@ -268,13 +632,221 @@ class Poller:
             except re.error:
                 # If misconfigured, fail open (don't hide anything) rather than crashing the exporter.
                 self._hide_progress_nodes_pat = None
+        # The node list is fixed for the Poller's lifetime, so resolve the
+        # pattern against it once; the per-poll check is then a set lookup.
+        pat = self._hide_progress_nodes_pat
+        self._hidden_nodes: frozenset = (
+            frozenset(n for n, _ in nodes if pat.search(n)) if pat else frozenset()
+        )
+
+        # Sort keys are static for the process lifetime, so emit them once
+        # here instead of every round. The Lighthouse row sorts above the
+        # Geth entries; hidden nodes get no row at all. Emitting at startup
+        # also guarantees the rows exist before the first poll completes.
+        if self.lighthouse_api_url:
+            g_sort_key.labels(node=self.lighthouse_label).set(0)
+        for sort_idx, (node_name, _) in enumerate(nodes, start=1):
+            if node_name not in self._hidden_nodes:
+                g_sort_key.labels(node=node_name).set(sort_idx)
+
+    def _fetch_node(self, name: str, url: str) -> Optional[Dict[str, Any]]:
+        """Fetch the raw RPC values for one node.
+
+        Runs on a worker thread: no Prometheus writes here, only network I/O.
+        Returns None when the node is unreachable (eth_blockNumber failed).
+        """
+        if self._fail_count.get(name, 0) >= 3:
+            # Known-sick node: one short probe instead of the full fetch, so a
+            # down node costs ~1s per poll rather than stacked 5s timeouts.
+            block_hex = rpc_call_optional(url, "eth_blockNumber", timeout=1.0, session=self._session)
+            if block_hex is None:
+                self._fail_count[name] += 1
+                return None
+            # Back up: resume the full fetch next round.
+            self._fail_count[name] = 0
+            return {"block_hex": block_hex, "peers_hex": None, "syncing": None}
+        try:
+            block_hex, peers_hex, syncing = rpc_batch(
+                url,
+                _PROBE_CALLS,
+                session=self._session,
+                body=_PROBE_BODY,
+            )
+        except Exception:
+            # Old clients may reject batch arrays; retry with single calls.
+            block_hex = rpc_call_optional(url, "eth_blockNumber", session=self._session)
+            if block_hex is None:
+                self._fail_count[name] = self._fail_count.get(name, 0) + 1
+                return None
+            # Optional / version-dependent.
+            peers_hex = rpc_call_optional(url, "net_peerCount", session=self._session)
+            syncing = rpc_call_optional(url, "eth_syncing", session=self._session)
+        if block_hex is None:
+            self._fail_count[name] = self._fail_count.get(name, 0) + 1
+            return None
+        self._fail_count[name] = 0
+        return {"block_hex": block_hex, "peers_hex": peers_hex, "syncing": syncing}
+
+    def _build_seed_paths(self, host_output_dir: Path, cutoff_block: int) -> None:
+        """Pre-compute the marker/progress/log paths used by the seeder."""
+        exports_dir = host_output_dir / "exports"
+        self.export_progress_path = exports_dir / f"mainnet-0-{cutoff_block}.rlp.progress"
+        self.export_file_path = exports_dir / f"mainnet-0-{cutoff_block}.rlp"
+        self.export_marker_path = exports_dir / f"mainnet-0-{cutoff_block}.rlp.exporting"
+        self.export_done_path = host_output_dir / f"seed-v1.16.7-export-{cutoff_block}.done"
+        self.seed_log_path = host_output_dir / "seed-v1.11.6.log"
+        self.seed_done_path = host_output_dir / f"seed-v1.11.6-{cutoff_block}.done"
+        self.import_marker_path = host_output_dir / f"seed-v1.11.6-import-{cutoff_block}.importing"
+
+    def _child(self, g: Gauge, **labels: str) -> Any:
+        """Memoized g.labels(...) lookup."""
+        key = (g, tuple(sorted(labels.items())))
+        child = self._child_cache.get(key)
+        if child is None:
+            child = g.labels(**labels)
+            self._child_cache[key] = child
+        return child
+
+    def _set_progress_info(self, node: str, progress: str, value: float = 1) -> None:
+        """Set the progress-info metric, relabelling only on actual change."""
+        last = self._last_progress_label.get(node)
+        if last is not None and last != progress:
+            try:
+                g_sync_progress_info.remove(node, last)
+            except Exception:
+                pass
+            self._child_cache.pop((g_sync_progress_info, (("node", node), ("progress", last))), None)
+        self._last_progress_label[node] = progress
+        self._child(g_sync_progress_info, node=node, progress=progress).set(value)
+
+    def _tail_cached(self, path: Path, n: int = 500_000) -> bytes:
+        """Tail a log file, reusing the previous read while it is unchanged."""
+        st = path.stat()
+        key = (st.st_size, st.st_mtime_ns)
+        cached = self._log_tail_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        tail = _tail_bytes(path, n)
+        self._log_tail_cache[path] = (key, tail)
+        return tail
+
+    @staticmethod
+    def _dir_names(d: Path) -> frozenset:
+        """Entry names of a directory via one scandir.
+
+        readdir batches entries, so this is far cheaper than a stat() per
+        status file when several of them share a directory.
+        """
+        try:
+            return frozenset(e.name for e in os.scandir(d))
+        except OSError:
+            return frozenset()
+
+    def _parse_import_tail(self, path: Path) -> Tuple[bool, int]:
+        """Parse (importing, latest imported block) from the seed log tail.
+
+        We keep a fairly large tail so a brief burst of export/status logs
+        doesn't push the latest "Imported new chain segment" line out of view.
+        """
+        st = path.stat()
+        key = (st.st_size, st.st_mtime_ns)
+        cached = self._log_parse_cache.get((path, "import"))
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        full = self._tail_cached(path)
+        importing = False
+        import_current = 0
+        win = _PARSE_WINDOW
+        while True:
+            tail = full[-win:] if len(full) > win else full
+            # rfind locates the last candidate line with a C-level substring scan,
+            # so the regex only ever runs on that small slice.
+            # Newer geth:
+            #   "Imported new chain segment               number=487,500"
+            idx = tail.rfind(b"Imported new chain segment")
+            if idx >= 0:
+                importing = True
+                m = _RE_IMPORTED_NEW.search(tail, idx)
+                if m:
+                    import_current = int(m.group(1).translate(None, b","))
+                break
+            if b"Importing blockchain" in tail:
+                importing = True
+            # Old geth import output:
+            #   "imported 2500 block(s) ... #215000 [...]"
+            idx = tail.rfind(b"block(s)")
+            if idx >= 0:
+                m2 = _RE_HASH_NUM.search(tail, idx)
+                if m2:
+                    import_current = int(m2.group(1).translate(None, b","))
+            if idx >= 0 or importing or len(tail) == len(full):
+                break
+            win *= 2
+        result = (importing, import_current)
+        self._log_parse_cache[(path, "import")] = (key, result)
+        return result
+
+    def _parse_export_tail(self, path: Path) -> int:
+        """Parse the latest exported block count from the seed log tail."""
+        st = path.stat()
+        key = (st.st_size, st.st_mtime_ns)
+        cached = self._log_parse_cache.get((path, "export"))
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        full = self._tail_cached(path)
+        export_current = 0
+        win = _PARSE_WINDOW
+        while True:
+            tail = full[-win:] if len(full) > win else full
+            # Latest occurrence via rfind, then one anchored search from it —
+            # no full finditer walk of the window.
+            idx = tail.rfind(b"Exporting blocks")
+            if idx >= 0:
+                m = _RE_EXPORTED.search(tail, idx)
+                if m:
+                    export_current = int(m.group(1).translate(None, b","))
+                break
+            if len(tail) == len(full):
+                break
+            win *= 2
+        self._log_parse_cache[(path, "export")] = (key, export_current)
+        return export_current
+
+    def _read_last_done(self, path: Path) -> Optional[int]:
+        """Read ``last_done`` from a JSON progress file, cached on (size, mtime)."""
+        try:
+            st = path.stat()
+        except OSError:
+            self._log_parse_cache.pop((path, "last_done"), None)
+            return None
+        key = (st.st_size, st.st_mtime_ns)
+        cached = self._log_parse_cache.get((path, "last_done"))
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        last_done = None
+        data = _read_json_file(path)
+        if isinstance(data, dict) and data.get("last_done") is not None:
+            try:
+                last_done = int(data["last_done"])
+            except Exception:
+                last_done = None
+        self._log_parse_cache[(path, "last_done")] = (key, last_done)
+        return last_done
+
+    def _parse_seed_log(self, path: Path) -> Tuple[Tuple[bool, int], int]:
+        """Run both seed-log parses together (executor task).
+
+        Submitted alongside the RPC fetches so the tail read and scan overlap
+        with the network round-trips instead of extending the poll after them.
+        The two parses share one cached tail read.
+        """
+        return self._parse_import_tail(path), self._parse_export_tail(path)
 
     def _hide_from_progress(self, node_name: str) -> bool:
-        if not node_name:
-            return False
-        if self._hide_progress_nodes_pat is None:
-            return False
-        return self._hide_progress_nodes_pat.search(node_name) is not None
+        return node_name in self._hidden_nodes
 
     def _remove_progress_series(self, node_name: str) -> None:
         """Remove label series for metrics used by progress panels.
@@ -296,6 +868,15 @@ class Poller:
                 g.remove(node=node_name)
             except Exception:
                 pass
+        last = self._last_progress_label.pop(node_name, None)
+        if last is not None:
+            try:
+                g_sync_progress_info.remove(node_name, last)
+            except Exception:
+                pass
+        # Cached children for removed series must not be reused.
+        for key in [k for k in self._child_cache if dict(k[1]).get("node") == node_name]:
+            del self._child_cache[key]
 
     def start(self) -> None:
         self._thread.start()
@@ -303,39 +884,56 @@ class Poller:
     def stop(self) -> None:
         self._stop.set()
         self._thread.join(timeout=5)
+        self._executor.shutdown(wait=False)
 
     def _run(self) -> None:
         # first node is the “top” reference
         top_name, _ = self.nodes[0]
 
-        # Stage checklist config.
-        cutoff_block = _env_int("CUTOFF_BLOCK", 1919999)
-        # Geth v1.0.x is Frontier-era; it cannot serve Homestead-era blocks.
-        # Track its progress against the last Frontier block instead of the global cutoff.
-        # Backwards-compatible env:
-        # - V1_0_3_TARGET_BLOCK (old)
-        # - V1_0_X_TARGET_BLOCK (new; applies to all v1.0.* nodes)
-        v1_0_target_block = _env_int("V1_0_X_TARGET_BLOCK", _env_int("V1_0_3_TARGET_BLOCK", 1149999))
-        host_output_dir = Path(os.environ.get("HOST_OUTPUT_DIR", "/host_output")).resolve()
-        lighthouse_metrics_url = (os.environ.get("LIGHTHOUSE_METRICS_URL", "") or "").strip().rstrip("/")
-
-        # How long we consider Lighthouse backfill "active" after observing progress.
-        backfill_activity_window_seconds = _env_float("LIGHTHOUSE_BACKFILL_ACTIVITY_WINDOW_SECONDS", 300.0)
-
-        # Pre-compute common file paths used by the seeder.
-        export_progress_path = host_output_dir / "exports" / f"mainnet-0-{cutoff_block}.rlp.progress"
-        export_file_path = host_output_dir / "exports" / f"mainnet-0-{cutoff_block}.rlp"
-        export_marker_path = host_output_dir / "exports" / f"mainnet-0-{cutoff_block}.rlp.exporting"
-        export_done_path = host_output_dir / f"seed-v1.16.7-export-{cutoff_block}.done"
-        seed_log_path = host_output_dir / "seed-v1.11.6.log"
-        seed_done_path = host_output_dir / f"seed-v1.11.6-{cutoff_block}.done"
-        import_marker_path = host_output_dir / f"seed-v1.11.6-import-{cutoff_block}.importing"
+        # Promote the per-instance config/paths to locals for the loop body.
+        cutoff_block = self.cutoff_block
+        v1_0_target_block = self.v1_0_target_block
+        lighthouse_metrics_url = self.lighthouse_metrics_url
+        backfill_activity_window_seconds = self.backfill_activity_window_seconds
+        export_progress_path = self.export_progress_path
+        export_marker_path = self.export_marker_path
+        export_done_path = self.export_done_path
+        seed_log_path = self.seed_log_path
+        seed_done_path = self.seed_done_path
+        import_marker_path = self.import_marker_path
+
+        # A process's environment cannot change underneath it, so one read at
+        # loop entry covers the lifetime of the poller.
+        interval = _env_float("POLL_INTERVAL_SECONDS", self.interval_seconds)
 
         while not self._stop.is_set():
-            # Clear dynamic label series each round so we don't accumulate stale values.
-            g_sync_progress_info.clear()
-            # Stage labels are also dynamic (we may add/rename stages); clear to prevent stale rows.
-            g_stage_status.clear()
+            # Fixed-deadline cadence: the fan-out time varies with the slowest
+            # node, so schedule the next round relative to the start of this
+            # one instead of sleeping a full interval after it finishes.
+            deadline = time.monotonic() + interval
+
+            # No per-round clear(): stage labels are static, and the dynamic
+            # `progress` label is diff-updated via _set_progress_info, which
+            # removes the old series only when the string actually changes.
+
+            # The status files live in two directories, so two readdir sweeps
+            # replace the per-file stat() probes. Everything below branches on
+            # these locals instead of re-probing the filesystem.
+            out_names = self._dir_names(seed_done_path.parent)
+            exports_names = self._dir_names(export_progress_path.parent)
+            export_progress_exists = export_progress_path.name in exports_names
+            export_marker_exists = export_marker_path.name in exports_names
+            export_done = export_done_path.name in out_names
+            seed_log_exists = seed_log_path.name in out_names
+            seed_done = seed_done_path.name in out_names
+            import_marker_exists = import_marker_path.name in out_names
+
+            # Parsed once per round; both the stage checklist and the phase
+            # row below consume the same value.
+            export_last_done = (
+                self._read_last_done(export_progress_path) if export_progress_exists else None
+            )
+
             blocks: Dict[str, int] = {}
 
             # Keep peer counts for checklist heuristics.
@@ -350,17 +948,42 @@ class Poller:
             lighthouse_sync_distance = 0
             lighthouse_backfill_workers = None
 
+            # Dispatch every network fetch up front so they run concurrently.
+            # Gauge updates stay on this thread: results are applied in node
+            # order below, which keeps prometheus_client free of contention.
+            lh_syncing_future: Optional[concurrent.futures.Future] = None
+            lh_metrics_future: Optional[concurrent.futures.Future] = None
+            if self.lighthouse_api_url:
+                lh_syncing_future = self._executor.submit(
+                    _http_get_json,
+                    f"{self.lighthouse_api_url}/eth/v1/node/syncing",
+                    session=self._session,
+                )
+                if lighthouse_metrics_url:
+                    lh_metrics_future = self._executor.submit(
+                        fetch_prom_metrics,
+                        f"{lighthouse_metrics_url}/metrics",
+                        {
+                            "beacon_processor_workers_active_gauge_by_type": 'type="chain_segment_backfill"',
+                            "beacon_processor_backfill_chain_segment_success_total": "",
+                        },
+                        session=self._session,
+                    )
+            seed_parse_future: Optional[concurrent.futures.Future] = None
+            if seed_log_exists:
+                seed_parse_future = self._executor.submit(self._parse_seed_log, seed_log_path)
+            node_futures: Dict[str, concurrent.futures.Future] = {}
+            for name, url in self.nodes:
+                # Gated nodes (see the v1.11.6 check below) get no RPCs at all.
+                if name == _SEED_GATED_NODE and not seed_done:
+                    continue
+                node_futures[name] = self._executor.submit(self._fetch_node, name, url)
+
             # Add a Lighthouse row into the same progress metrics (using slots, not blocks).
             if self.lighthouse_api_url:
-                # Keep this row sorted above Geth entries.
-                lighthouse_sort_key = 0
                 node_label = self.lighthouse_label
-
-                # Always emit *some* Lighthouse series so Grafana shows the row from the start.
-                # If the API isn't reachable yet, we mark it down (up=0) and keep progress at 0.
-                g_sort_key.labels(node=node_label).set(lighthouse_sort_key)
                 try:
-                    syncing = _http_get_json(f"{self.lighthouse_api_url}/eth/v1/node/syncing")
+                    syncing = lh_syncing_future.result()
                     data = (syncing or {}).get("data") or {}
                     head_slot = int(data.get("head_slot") or 0)
                     distance = int(data.get("sync_distance") or 0)
@@ -372,21 +995,18 @@ class Poller:
 
                     # Best-effort: detect whether Lighthouse is currently doing backfill work.
                     # This uses its /metrics endpoint and the worker gauge for backfill chain segments.
-                    if lighthouse_metrics_url:
+                    if lh_metrics_future is not None:
                         try:
-                            metrics_text = _http_get_text(f"{lighthouse_metrics_url}/metrics")
-                            lighthouse_backfill_workers = _parse_prom_number(
-                                metrics_text,
-                                "beacon_processor_workers_active_gauge_by_type",
-                                'type="chain_segment_backfill"',
-                            )
+                            lh_metrics = lh_metrics_future.result()
+                            lighthouse_backfill_workers = lh_metrics[
+                                "beacon_processor_workers_active_gauge_by_type"
+                            ]
 
                             # Also detect backfill activity by watching a monotonic counter.
                             # This is more stable across versions than relying purely on worker gauges.
-                            backfill_total = _parse_prom_number(
-                                metrics_text,
-                                "beacon_processor_backfill_chain_segment_success_total",
-                            )
+                            backfill_total = lh_metrics[
+                                "beacon_processor_backfill_chain_segment_success_total"
+                            ]
                             if backfill_total is not None:
                                 now_ts = time.time()
                                 if (
@@ -398,161 +1018,140 @@ class Poller:
                         except Exception:
                             lighthouse_backfill_workers = None
 
-                    g_sort_key.labels(node=node_label).set(lighthouse_sort_key)
-                    g_up.labels(node=node_label).set(1)
-                    g_syncing.labels(node=node_label).set(1 if data.get("is_syncing") else 0)
-                    g_sync_current.labels(node=node_label).set(head_slot)
-                    g_sync_highest.labels(node=node_label).set(target_slot)
-                    g_sync_remaining.labels(node=node_label).set(max(0, distance))
-                    g_effective_head.labels(node=node_label).set(head_slot)
-                    g_sync_target.labels(node=node_label).set(target_slot)
+                    self._child(g_up, node=node_label).set(1)
+                    self._child(g_syncing, node=node_label).set(1 if data.get("is_syncing") else 0)
+                    self._child(g_sync_current, node=node_label).set(head_slot)
+                    self._child(g_sync_highest, node=node_label).set(target_slot)
+                    self._child(g_sync_remaining, node=node_label).set(max(0, distance))
+                    self._child(g_effective_head, node=node_label).set(head_slot)
+                    self._child(g_sync_target, node=node_label).set(target_slot)
                     pct = (head_slot * 100.0 / target_slot) if target_slot > 0 else 0.0
-                    g_sync_percent.labels(node=node_label).set(pct)
+                    self._child(g_sync_percent, node=node_label).set(pct)
                     progress = f"{head_slot}/{target_slot} ({pct:.1f}%)" if target_slot > 0 else "0/0 (0.0%)"
-                    g_sync_progress_info.labels(node=node_label, progress=progress).set(1)
+                    self._set_progress_info(node_label, progress)
                 except Exception:
                     # Lighthouse API not ready yet (or temporarily unreachable): keep the row visible but down.
-                    g_up.labels(node=node_label).set(0)
-                    g_syncing.labels(node=node_label).set(0)
-                    g_sync_current.labels(node=node_label).set(0)
-                    g_sync_highest.labels(node=node_label).set(0)
-                    g_sync_remaining.labels(node=node_label).set(0)
-                    g_effective_head.labels(node=node_label).set(0)
-                    g_sync_target.labels(node=node_label).set(0)
-                    g_sync_percent.labels(node=node_label).set(0)
-                    g_sync_progress_info.labels(node=node_label, progress="down").set(0)
-
-            for idx, (name, url) in enumerate(self.nodes, start=1):
+                    for child in self._lh_zero_children:
+                        child.set(0)
+                    self._set_progress_info(node_label, "down", 0)
+
+            # Names come pre-stripped (and interned) from parse_node_urls, so
+            # no per-iteration strip() is needed here.
+            for name, url in self.nodes:
                 hide_from_progress = self._hide_from_progress(name)
                 if hide_from_progress:
                     # Ensure stale progress-series are removed so the node row disappears.
                     self._remove_progress_series(name)
-                else:
-                    g_sort_key.labels(node=name).set(idx)
 
                 # Gating: don't show the v1.11.6 bridge as "up" until it's actually been
                 # offline-seeded. Otherwise dashboards look like the bridge is available even
                 # though it cannot serve the historical range yet.
                 #
                 # The export/import progress is still shown via the synthetic phase rows.
-                if name.strip() == "Geth v1.11.6" and not seed_done_path.exists():
-                    g_up.labels(node=name).set(0)
+                if name == _SEED_GATED_NODE and not seed_done:
                     node_up[name] = False
                     node_syncing[name] = False
                     node_effective_head[name] = 0
                     peers[name] = 0
-                    g_block.labels(node=name).set(0)
-                    g_peers.labels(node=name).set(0)
-                    if not hide_from_progress:
-                        g_syncing.labels(node=name).set(0)
-                        g_sync_current.labels(node=name).set(0)
-                        g_sync_highest.labels(node=name).set(0)
-                        g_sync_remaining.labels(node=name).set(0)
-                        g_effective_head.labels(node=name).set(0)
-                        g_sync_progress_info.labels(node=name, progress="gated (waiting for seed)").set(0)
-                        g_sync_target.labels(node=name).set(0)
-                        g_sync_percent.labels(node=name).set(0)
+                    # The gauge block here is all constant zeros while gated;
+                    # emit it once per gating episode, not every round.
+                    if not self._gate_emitted:
+                        self._gate_emitted = True
+                        self._child(g_up, node=name).set(0)
+                        self._child(g_block, node=name).set(0)
+                        self._child(g_peers, node=name).set(0)
+                        if not hide_from_progress:
+                            self._child(g_syncing, node=name).set(0)
+                            self._child(g_sync_current, node=name).set(0)
+                            self._child(g_sync_highest, node=name).set(0)
+                            self._child(g_sync_remaining, node=name).set(0)
+                            self._child(g_effective_head, node=name).set(0)
+                            self._set_progress_info(name, "gated (waiting for seed)", 0)
+                            self._child(g_sync_target, node=name).set(0)
+                            self._child(g_sync_percent, node=name).set(0)
                     continue
+                if name == _SEED_GATED_NODE:
+                    # Seed completed: re-emit fresh zeros if it ever gates again.
+                    self._gate_emitted = False
 
                 # Some nodes should display progress vs a fixed historical target rather than the
                 # node-reported `eth_syncing.highestBlock` (which may be missing/0 on older clients).
                 fixed_target: int | None
-                if name.strip().startswith("Geth v1.0."):
+                if name.startswith("Geth v1.0."):
                     fixed_target = v1_0_target_block
-                elif name.strip() in {"Geth v1.11.6", "Geth v1.10.8", "Geth v1.9.25", "Geth v1.3.6"}:
+                elif name in _CUTOFF_TARGET_NODES:
                     # These nodes are expected to sync up to the fixed historical cutoff.
                     fixed_target = cutoff_block
                 else:
                     fixed_target = None
                 try:
-                    # Required for "up".
-                    block_hex = rpc_call_optional(url, "eth_blockNumber")
-                    if block_hex is None:
+                    fetch_future = node_futures.get(name)
+                    fetched = fetch_future.result() if fetch_future is not None else None
+                    # eth_blockNumber is required for "up".
+                    if fetched is None:
                         raise RuntimeError("eth_blockNumber failed")
-
-                    # Optional / version-dependent.
-                    peers_hex = rpc_call_optional(url, "net_peerCount")
-                    syncing = rpc_call_optional(url, "eth_syncing")
-
-                    block_num = hex_to_int(block_hex)
-                    peer_count = hex_to_int(peers_hex)
-
-                    g_up.labels(node=name).set(1)
-                    node_up[name] = True
-                    g_block.labels(node=name).set(block_num)
-                    g_peers.labels(node=name).set(peer_count)
-                    blocks[name] = block_num
-                    peers[name] = peer_count
-
+                    # Convert everything up front: a malformed payload raises
+                    # here, before any gauge is touched, so a node is either
+                    # fully updated or handled by the down branch — never torn.
+                    block_num = hex_to_int(fetched["block_hex"])
+                    peer_count = hex_to_int(fetched["peers_hex"])
+                    syncing = fetched["syncing"]
                     # Very old clients may not support eth_syncing; treat as not syncing.
                     if syncing is None or syncing is False:
-                        node_syncing[name] = False
-                        node_effective_head[name] = block_num
-                        if not hide_from_progress:
-                            g_syncing.labels(node=name).set(0)
-                            g_sync_current.labels(node=name).set(0)
-                            g_sync_highest.labels(node=name).set(0)
-                            g_effective_head.labels(node=name).set(block_num)
-                        target = fixed_target if fixed_target is not None else block_num
+                        is_syncing = False
+                        cur = 0
+                        hi = 0
+                        eff = block_num
                         # Even if the node reports "not syncing", for historical targets
                         # (e.g. v1.11.6 seeded cutoff) we still want an informative "remaining".
-                        if not hide_from_progress:
-                            g_sync_remaining.labels(node=name).set(max(0, target - block_num))
-                            pct = (block_num * 100.0 / target) if target > 0 else 0.0
-                            progress = f"{block_num}/{target} ({pct:.1f}%)" if target > 0 else "0/0 (0.0%)"
-                            g_sync_target.labels(node=name).set(target)
-                            g_sync_percent.labels(node=name).set(pct)
-                            g_sync_progress_info.labels(node=name, progress=progress).set(1)
-
-                            self._last_seen[name] = {
-                                "block": float(block_num),
-                                "peers": float(peer_count),
-                                "sync_current": 0.0,
-                                "sync_highest": 0.0,
-                                "effective": float(block_num),
-                                "target": float(target),
-                                "percent": float(pct),
-                            }
+                        target = fixed_target if fixed_target is not None else block_num
                     else:
                         # Some clients return a dict with hex values.
+                        is_syncing = True
                         cur = hex_to_int(syncing.get("currentBlock"))
                         hi = hex_to_int(syncing.get("highestBlock"))
-                        node_syncing[name] = True
-                        if not hide_from_progress:
-                            g_syncing.labels(node=name).set(1)
-                            g_sync_current.labels(node=name).set(cur)
-                            g_sync_highest.labels(node=name).set(hi)
                         eff = max(block_num, cur)
-                        node_effective_head[name] = eff
                         # If a fixed target is configured, we explicitly report remaining vs that
                         # target (even if the node reports a much higher eth_syncing.highestBlock).
                         target = fixed_target if fixed_target is not None else max(hi, eff)
-                        if not hide_from_progress:
-                            g_effective_head.labels(node=name).set(eff)
-                            # Use our best-effort target (not just hi-cur) so older clients that report
-                            # highestBlock=0 still show a meaningful remaining curve.
-                            g_sync_remaining.labels(node=name).set(max(0, target - eff))
-                            pct = (eff * 100.0 / target) if target > 0 else 0.0
-                            progress = f"{eff}/{target} ({pct:.1f}%)"
-                            g_sync_target.labels(node=name).set(target)
-                            g_sync_percent.labels(node=name).set(pct)
-                            g_sync_progress_info.labels(node=name, progress=progress).set(1)
-
-                            self._last_seen[name] = {
-                                "block": float(block_num),
-                                "peers": float(peer_count),
-                                "sync_current": float(cur),
-                                "sync_highest": float(hi),
-                                "effective": float(eff),
-                                "target": float(target),
-                                "percent": float(pct),
-                            }
+                    # Use our best-effort target (not just hi-cur) so older clients that report
+                    # highestBlock=0 still show a meaningful remaining curve.
+                    pct = (eff * 100.0 / target) if target > 0 else 0.0
+                    progress = f"{eff}/{target} ({pct:.1f}%)" if target > 0 else "0/0 (0.0%)"
+
+                    self._child(g_up, node=name).set(1)
+                    node_up[name] = True
+                    self._child(g_block, node=name).set(block_num)
+                    self._child(g_peers, node=name).set(peer_count)
+                    blocks[name] = block_num
+                    peers[name] = peer_count
+                    node_syncing[name] = is_syncing
+                    node_effective_head[name] = eff
+                    if not hide_from_progress:
+                        self._child(g_syncing, node=name).set(1 if is_syncing else 0)
+                        self._child(g_sync_current, node=name).set(cur)
+                        self._child(g_sync_highest, node=name).set(hi)
+                        self._child(g_effective_head, node=name).set(eff)
+                        self._child(g_sync_remaining, node=name).set(max(0, target - eff))
+                        self._child(g_sync_target, node=name).set(target)
+                        self._child(g_sync_percent, node=name).set(pct)
+                        self._set_progress_info(name, progress)
+
+                        self._last_seen[name] = {
+                            "block": float(block_num),
+                            "peers": float(peer_count),
+                            "sync_current": float(cur),
+                            "sync_highest": float(hi),
+                            "effective": float(eff),
+                            "target": float(target),
+                            "percent": float(pct),
+                        }
 
                 except Exception:
                     # Mark node as down.
                     # IMPORTANT: keep last-seen metrics (if any) so dashboards remain stable while
                     # nodes are intentionally cycled (e.g. seeding export/import).
-                    g_up.labels(node=name).set(0)
+                    self._child(g_up, node=name).set(0)
                     node_up[name] = False
                     node_syncing[name] = False
                     node_effective_head[name] = 0
@@ -564,11 +1163,11 @@ class Poller:
                         # Still emit the basic series (up/block/peers) so "Geth status" remains meaningful.
                         cached = self._last_seen.get(name)
                         if cached:
-                            g_block.labels(node=name).set(int(cached.get("block") or 0))
-                            g_peers.labels(node=name).set(int(cached.get("peers") or 0))
+                            self._child(g_block, node=name).set(int(cached.get("block") or 0))
+                            self._child(g_peers, node=name).set(int(cached.get("peers") or 0))
                         else:
-                            g_block.labels(node=name).set(0)
-                            g_peers.labels(node=name).set(0)
+                            self._child(g_block, node=name).set(0)
+                            self._child(g_peers, node=name).set(0)
                         continue
 
                     cached = self._last_seen.get(name)
@@ -581,44 +1180,51 @@ class Poller:
                         target = int(cached.get("target") or 0)
                         pct = float(cached.get("percent") or 0.0)
 
-                        g_block.labels(node=name).set(block_num)
-                        g_peers.labels(node=name).set(peer_count)
+                        self._child(g_block, node=name).set(block_num)
+                        self._child(g_peers, node=name).set(peer_count)
                         # Node is down: report syncing=0, but keep last-known numeric progress.
-                        g_syncing.labels(node=name).set(0)
-                        g_sync_current.labels(node=name).set(cur)
-                        g_sync_highest.labels(node=name).set(hi)
-                        g_effective_head.labels(node=name).set(eff)
-                        g_sync_target.labels(node=name).set(target)
-                        g_sync_remaining.labels(node=name).set(max(0, target - eff))
-                        g_sync_percent.labels(node=name).set(pct)
+                        self._child(g_syncing, node=name).set(0)
+                        self._child(g_sync_current, node=name).set(cur)
+                        self._child(g_sync_highest, node=name).set(hi)
+                        self._child(g_effective_head, node=name).set(eff)
+                        self._child(g_sync_target, node=name).set(target)
+                        self._child(g_sync_remaining, node=name).set(max(0, target - eff))
+                        self._child(g_sync_percent, node=name).set(pct)
                         progress = f"{eff}/{target} ({pct:.1f}%) (cached)" if target > 0 else "down"
-                        g_sync_progress_info.labels(node=name, progress=progress).set(1)
+                        self._set_progress_info(name, progress)
                     else:
-                        g_block.labels(node=name).set(0)
-                        g_peers.labels(node=name).set(0)
-                        g_syncing.labels(node=name).set(0)
-                        g_sync_current.labels(node=name).set(0)
-                        g_sync_highest.labels(node=name).set(0)
-                        g_sync_remaining.labels(node=name).set(0)
-                        g_effective_head.labels(node=name).set(0)
-                        g_sync_target.labels(node=name).set(0)
-                        g_sync_percent.labels(node=name).set(0)
-                        g_sync_progress_info.labels(node=name, progress="down").set(1)
+                        self._child(g_block, node=name).set(0)
+                        self._child(g_peers, node=name).set(0)
+                        self._child(g_syncing, node=name).set(0)
+                        self._child(g_sync_current, node=name).set(0)
+                        self._child(g_sync_highest, node=name).set(0)
+                        self._child(g_sync_remaining, node=name).set(0)
+                        self._child(g_effective_head, node=name).set(0)
+                        self._child(g_sync_target, node=name).set(0)
+                        self._child(g_sync_percent, node=name).set(0)
+                        self._set_progress_info(name, "down")
 
             # Lag metrics: compute after all blocks are fetched.
             if top_name in blocks:
                 top_block = blocks[top_name]
                 for name, _ in self.nodes:
                     if name in blocks:
-                        g_lag_vs_top.labels(node=name).set(max(0, top_block - blocks[name]))
+                        self._child(g_lag_vs_top, node=name).set(max(0, top_block - blocks[name]))
                     else:
                         # If unknown this round, don't overwrite.
                         pass
 
             # --- Stage checklist ---
-            # Helper to emit 0/1/2 for a stage label.
+            # Helper to emit 0/1/2 for a stage label. Stage transitions happen
+            # on the order of hours, so skip the gauge write (and its lock)
+            # whenever the status is unchanged; the label set is fixed, so no
+            # removal pass is needed.
+            last_stage = self._last_stage
+
             def set_stage(stage: str, status: int) -> None:
-                g_stage_status.labels(stage=stage).set(status)
+                if last_stage.get(stage) != status:
+                    last_stage[stage] = status
+                    self._child(g_stage_status, stage=stage).set(status)
 
             # 1) Lighthouse sync/backfill readiness (combined)
             # Criteria for DONE matches the prior "indexing/backfill" stage:
@@ -654,20 +1260,12 @@ class Poller:
 
             # 3) Geth v1.16.7 exporting data (seed RLP export)
             # Prefer explicit marker/done files (written by seed-v1.11.6-when-ready.sh).
-            if export_done_path.exists():
+            if export_done:
                 set_stage("3. Geth v1.16.7 (export)", 2)
-            elif export_marker_path.exists():
+            elif export_marker_exists:
                 set_stage("3. Geth v1.16.7 (export)", 1)
             else:
                 # Backwards-compatible fallback for any older runs that used a .progress file.
-                export_last_done = None
-                if export_progress_path.exists():
-                    data = _read_json_file(export_progress_path)
-                    if isinstance(data, dict) and data.get("last_done") is not None:
-                        try:
-                            export_last_done = int(data.get("last_done"))
-                        except Exception:
-                            export_last_done = None
                 if export_last_done is None:
                     set_stage("3. Geth v1.16.7 (export)", 0)
                 else:
@@ -677,35 +1275,20 @@ class Poller:
                     )
 
             # 4) Geth v1.11.6 importing data
-            if seed_done_path.exists():
+            if seed_done:
                 set_stage("4. Geth v1.11.6 (import)", 2)
             else:
                 importing = False
                 import_current = 0
                 try:
-                    if seed_log_path.exists():
-                        # Keep a fairly large tail so a brief burst of export/status logs
-                        # doesn't push the latest "Imported new chain segment" line out of view.
-                        tail = seed_log_path.read_text(errors="ignore")[-500000:]
-                        if "Importing blockchain" in tail or "Imported new chain segment" in tail:
-                            importing = True
-                        # Best-effort: parse latest imported block number from the log tail.
-                        # Newer geth:
-                        #   "Imported new chain segment               number=487,500"
-                        m = re.findall(r"Imported new chain segment\s+number=([0-9,]+)", tail)
-                        if m:
-                            import_current = int(m[-1].replace(",", ""))
-                        else:
-                            # Old geth import output:
-                            #   "imported 2500 block(s) ... #215000 [...]"
-                            m2 = re.findall(r"imported\s+[0-9,]+\s+block\(s\).*?#([0-9,]+)", tail, flags=re.IGNORECASE)
-                            if m2:
-                                import_current = int(m2[-1].replace(",", ""))
+                    if seed_parse_future is not None:
+                        # Best-effort: latest imported block number from the log tail.
+                        importing, import_current = seed_parse_future.result()[0]
                 except Exception:
                     importing = False
                 set_stage(
                     "4. Geth v1.11.6 (import)",
-                    1 if (import_marker_path.exists() or importing) else 0,
+                    1 if (import_marker_exists or importing) else 0,
                 )
 
             # 5-8) Legacy bridge nodes syncing to their historical targets (normal P2P sync via static peering).
@@ -737,53 +1320,43 @@ class Poller:
                 running: bool,
                 up: bool,
             ) -> None:
-                g_sort_key.labels(node=node_label).set(sort_key)
+                self._child(g_sort_key, node=node_label).set(sort_key)
                 # Keep the row visible even when the phase isn't actively running;
                 # otherwise dashboards may drop it and it looks like progress reset.
-                g_up.labels(node=node_label).set(1 if up else 0)
-                g_effective_head.labels(node=node_label).set(current)
-                g_sync_target.labels(node=node_label).set(target)
-                g_sync_remaining.labels(node=node_label).set(max(0, target - current))
+                self._child(g_up, node=node_label).set(1 if up else 0)
+                self._child(g_effective_head, node=node_label).set(current)
+                self._child(g_sync_target, node=node_label).set(target)
+                self._child(g_sync_remaining, node=node_label).set(max(0, target - current))
                 pct = (current * 100.0 / target) if target > 0 else 0.0
-                g_sync_percent.labels(node=node_label).set(pct)
+                self._child(g_sync_percent, node=node_label).set(pct)
                 progress = f"{current}/{target} ({pct:.1f}%)" if target > 0 else "0/0 (0.0%)"
-                g_sync_progress_info.labels(node=node_label, progress=progress).set(1)
-                g_syncing.labels(node=node_label).set(1 if running else 0)
+                self._set_progress_info(node_label, progress)
+                self._child(g_syncing, node=node_label).set(1 if running else 0)
 
             # Determine export progress for synthetic row.
             # IMPORTANT: `geth_up` for phase rows should reflect *active running*, not mere file presence.
             # (Grafana's "Geth status" panel intentionally ORs node health with phase-row health.)
-            export_running = export_marker_path.exists()
+            export_running = export_marker_exists
 
             # Prefer the explicit progress file written by the seeder.
-            export_current = 0
-            if export_progress_path.exists():
-                data = _read_json_file(export_progress_path)
-                if isinstance(data, dict) and data.get("last_done") is not None:
-                    try:
-                        export_current = int(data.get("last_done"))
-                    except Exception:
-                        export_current = 0
+            export_current = export_last_done if export_last_done is not None else 0
 
             # If DONE file exists, pin to full cutoff regardless of parsing.
-            if export_done_path.exists():
+            if export_done:
                 export_current = cutoff_block
 
             # Fallback: parse export progress from the seed log if present (older deployments).
-            if export_current == 0 and not export_done_path.exists():
+            if export_current == 0 and not export_done:
                 # Newer geth logs during export contain:
                 #   "Exporting blocks ... exported=123,456"
                 try:
-                    if seed_log_path.exists():
-                        tail = seed_log_path.read_text(errors="ignore")[-500000:]
-                        m = re.findall(r"Exporting blocks\s+exported=([0-9,]+)", tail)
-                        if m:
-                            export_current = int(m[-1].replace(",", ""))
+                    if seed_parse_future is not None:
+                        export_current = seed_parse_future.result()[1]
                 except Exception:
-                    export_current = export_current
+                    pass
 
             # Keep the synthetic row visible at the end (DONE) for charts/panels that gate on geth_up.
-            export_up = export_running or export_done_path.exists()
+            export_up = export_running or export_done
             emit_phase_row(
                 "Geth v1.16.7 (export)",
                 1.50,
@@ -794,8 +1367,8 @@ class Poller:
             )
 
             # Determine import progress for synthetic row.
-            import_done = seed_done_path.exists()
-            import_running = (import_marker_path.exists() or importing) if not import_done else False
+            import_done = seed_done
+            import_running = (import_marker_exists or importing) if not import_done else False
             # If done, show full cutoff.
             import_display = cutoff_block if import_done else import_current
             import_up = import_running
@@ -808,7 +1381,7 @@ class Poller:
                 import_up,
             )
 
-            self._stop.wait(self.interval_seconds)
+            self._stop.wait(max(0.0, deadline - time.monotonic()))
 
 
 @app.get("/metrics")
@@ -830,8 +1403,11 @@ def main() -> None:
     poller = Poller(node_urls, interval_seconds=interval, lighthouse_api_url=lighthouse_api_url)
     poller.start()
 
-    # Flask dev server is fine here (internal-only in docker network).
-    app.run(host="0.0.0.0", port=port, debug=False)
+    if _waitress_serve is not None:
+        _waitress_serve(app, host="0.0.0.0", port=port, threads=4)
+    else:
+        # Flask dev server is fine here (internal-only in docker network).
+        app.run(host="0.0.0.0", port=port, debug=False)
 
 
 if __name__ == "__main__":